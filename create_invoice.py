@@ -11,11 +11,17 @@ Usage:
 
 import argparse
 import csv
+import hashlib
 import json
+import os
+import re
 import subprocess
 import tomllib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from decimal import Decimal
+from functools import lru_cache
+from io import BytesIO
+from itertools import accumulate
 from pathlib import Path
 from typing import Any
 
@@ -23,13 +29,98 @@ from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.lib.rl_accel import escapePDF, fp_str
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, HRFlowable
 from reportlab.lib.enums import TA_LEFT, TA_RIGHT, TA_CENTER
 
+# A batch job: (date in YYYY-MM-DD format, line items, output PDF path)
+InvoiceJob = tuple[str, list[dict], str]
+
+# Below this many per-file jobs, process pool start-up costs more than it saves
+_PARALLEL_MIN_JOBS = 4
+
+_STYLES = {
+    "normal": ParagraphStyle("Normal", fontName="Helvetica", fontSize=10),
+    "sender": ParagraphStyle("Sender", fontName="Helvetica", fontSize=10, leading=14),
+    "invoice_title": ParagraphStyle("InvoiceTitle", fontName="Helvetica-Bold", fontSize=28,
+                                     textColor=colors.grey, alignment=TA_RIGHT),
+    "meta": ParagraphStyle("Meta", fontName="Helvetica", fontSize=10, alignment=TA_RIGHT),
+    "section_header": ParagraphStyle("SectionHeader", fontName="Helvetica-Bold", fontSize=10),
+    "client": ParagraphStyle("Client", fontName="Helvetica", fontSize=10, leading=14),
+    "center": ParagraphStyle("Center", fontName="Helvetica", fontSize=10, alignment=TA_CENTER),
+    "center_bold": ParagraphStyle("CenterBold", fontName="Helvetica-Bold", fontSize=10,
+                                   alignment=TA_CENTER),
+    "note": ParagraphStyle("Note", fontName="Helvetica-Oblique", fontSize=9,
+                           textColor=colors.grey, alignment=TA_CENTER),
+    "thanks": ParagraphStyle("Thanks", fontName="Helvetica-BoldOblique", fontSize=10,
+                              alignment=TA_CENTER),
+    "footer": ParagraphStyle("Footer", fontName="Helvetica", fontSize=8, alignment=TA_CENTER),
+}
+
+_HEADER_TABLE_STYLE = TableStyle([
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ("ALIGN", (1, 0), (1, -1), "RIGHT"),
+])
+
+_ITEMS_COL_WIDTHS = [0.8 * inch, 4.0 * inch, 1.0 * inch, 1.2 * inch]
+
+_ITEMS_TABLE_STYLE = TableStyle([
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+    ("FONTSIZE", (0, 0), (-1, -1), 10),
+    ("ALIGN", (0, 0), (2, -1), "LEFT"),
+    ("ALIGN", (3, 0), (3, -1), "RIGHT"),
+    ("GRID", (0, 0), (-1, -2), 0.5, colors.black),
+    ("BOX", (2, -1), (3, -1), 0.5, colors.black),
+    ("LINEABOVE", (2, -1), (3, -1), 0.5, colors.black),
+    ("FONTNAME", (2, -1), (3, -1), "Helvetica-Bold"),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("TOPPADDING", (0, 0), (-1, -1), 4),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+])
+
+# Fixed-layout canvas renderer geometry, measured from the Platypus output above.
+# Invoices with more line items, or text that would wrap, fall back to Platypus.
+_FIXED_ITEM_ROWS = 7
+_FIXED_PAGE_CENTER = letter[0] / 2
+_FIXED_CELL_PADDING = 6
+_FIXED_TEXT_LEFT = 0.75 * inch + _FIXED_CELL_PADDING
+_FIXED_TEXT_RIGHT = letter[0] - 0.75 * inch - _FIXED_CELL_PADDING
+_FIXED_HEADER_TEXT_WIDTH = 3.5 * inch - 2 * _FIXED_CELL_PADDING
+_FIXED_BODY_TEXT_WIDTH = _FIXED_TEXT_RIGHT - _FIXED_TEXT_LEFT
+_FIXED_COL_EDGES = list(accumulate(_ITEMS_COL_WIDTHS, initial=0.75 * inch))
+_FIXED_LINE_LEADING = 14
+_FIXED_SENDER_TOP = 737
+_FIXED_TITLE_BASELINE = 719
+_FIXED_DATE_BASELINE = 661
+_FIXED_NUMBER_BASELINE = 649
+_FIXED_BILL_TO_BASELINE = 612.4
+_FIXED_BILL_TO_RULE = 606.4
+_FIXED_CLIENT_TOP = 589.4
+_FIXED_TABLE_TOP = 525.4
+_FIXED_ROW_HEIGHT = 20
+_FIXED_CELL_BASELINE_OFFSET = 14
+_FIXED_BANK_TOP = 313.8
+_FIXED_BANK_LEADING = 12
+_FIXED_NOTE_BASELINE = 264.4
+_FIXED_THANKS_BASELINE = 240.6
+_FIXED_FOOTER_BASELINE = 209
+
+# Byte width reserved for each per-invoice text slot in an InvoiceTemplate
+_TEMPLATE_SLOT_BYTES = 128
+
 
 def load_config(config_path: Path | None = None) -> dict[str, Any]:
     if config_path is None:
         config_path = Path(__file__).parent / "config.toml"
+    return _load_config_cached(str(config_path), config_path.stat().st_mtime_ns)
+
+
+# Keyed on mtime so an edited config is re-read; the returned dict is shared between callers
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> dict[str, Any]:
     with open(config_path, "rb") as f:
         return tomllib.load(f)
 
@@ -59,8 +150,11 @@ def parse_args():
     parser.add_argument("--description", type=str, help="Description for the line item")
     parser.add_argument("--date", type=str, default=datetime.now().strftime("%Y-%m-%d"),
                         help="Invoice date in YYYY-MM-DD format (default: today)")
-    parser.add_argument("--csv", type=str, help="CSV file with columns: hours, description, rate")
-    parser.add_argument("--output", type=str, help="Output PDF filename (auto-generated if not specified)")
+    parser.add_argument("--csv", type=str, nargs="+",
+                        help="CSV file(s) with columns: hours, description, rate (one invoice per file)")
+    parser.add_argument("--output", type=str,
+                        help="Output PDF filename (auto-generated if not specified); "
+                             "with multiple CSV files, all invoices are combined into this file")
     parser.add_argument("--config", type=str, help="Path to config file (default: config.toml)")
     parser.add_argument("--op-item", type=str, 
                         help="1Password secret reference for config (e.g., 'op://vault/item/field')")
@@ -70,33 +164,54 @@ def parse_args():
 
 
 def load_line_items_from_csv(csv_path: str) -> list[dict]:
-    items = []
     with open(csv_path, newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            items.append({
-                "hours": float(row["hours"]),
-                "description": row["description"],
-                "rate": float(row["rate"]),
-            })
-    return items
-
-
-def format_currency(amount: float) -> str:
-    return f"${amount:,.2f}"
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return []
+        hours_i, desc_i, rate_i = header.index("hours"), header.index("description"), header.index("rate")
+        # Skip blank lines, as csv.DictReader does
+        return [
+            {"hours": float(row[hours_i]), "description": row[desc_i], "rate": float(row[rate_i])}
+            for row in reader if row
+        ]
+
+
+def format_currency(cents: int) -> str:
+    sign = "-" if cents < 0 else ""
+    dollars, cents = divmod(abs(cents), 100)
+    return f"{sign}${dollars:,}.{cents:02d}"
+
+
+# Batches usually share a handful of dates, so each one is parsed and formatted once
+@lru_cache(maxsize=256)
+def _invoice_date_and_number(date_str: str, number_prefix: str) -> tuple[str, str]:
+    invoice_date = datetime.strptime(date_str, "%Y-%m-%d")
+    invoice_number = f"{number_prefix}{invoice_date.strftime('%Y-%m-%d')}"
+    formatted_date = f"{invoice_date:%B} {invoice_date.day}, {invoice_date.year}"
+    return formatted_date, invoice_number
 
 
-def create_invoice(date_str: str, line_items: list[dict], output_path: str, config: dict[str, Any]):
-    sender = config["sender"]
-    client = config["client"]
-    bank = config["bank"]
-    invoice_cfg = config["invoice"]
+def _line_item_rows(line_items: list[dict]) -> tuple[list[list[str]], int]:
+    rows = []
+    total_cents = 0
+    for item in line_items:
+        hours = item["hours"]
+        desc = item["description"]
+        rate = item["rate"]
+        amount_cents = round(hours * rate * 100)
+        total_cents += amount_cents
+        rows.append([
+            f"{hours:.1f}" if hours else "",
+            desc,
+            f"${rate:.2f}",
+            format_currency(amount_cents),
+        ])
+    return rows, total_cents
 
-    invoice_date = datetime.strptime(date_str, "%Y-%m-%d")
-    invoice_number = f"{invoice_cfg['number_prefix']}{invoice_date.strftime('%Y-%m-%d')}"
-    formatted_date = invoice_date.strftime("%B %d, %Y").replace(" 0", " ")
 
-    doc = SimpleDocTemplate(
+def _new_doc(output_path: str) -> SimpleDocTemplate:
+    return SimpleDocTemplate(
         output_path,
         pagesize=letter,
         leftMargin=0.75 * inch,
@@ -105,23 +220,15 @@ def create_invoice(date_str: str, line_items: list[dict], output_path: str, conf
         bottomMargin=0.5 * inch,
     )
 
-    styles = {
-        "normal": ParagraphStyle("Normal", fontName="Helvetica", fontSize=10),
-        "sender": ParagraphStyle("Sender", fontName="Helvetica", fontSize=10, leading=14),
-        "invoice_title": ParagraphStyle("InvoiceTitle", fontName="Helvetica-Bold", fontSize=28,
-                                         textColor=colors.grey, alignment=TA_RIGHT),
-        "meta": ParagraphStyle("Meta", fontName="Helvetica", fontSize=10, alignment=TA_RIGHT),
-        "section_header": ParagraphStyle("SectionHeader", fontName="Helvetica-Bold", fontSize=10),
-        "client": ParagraphStyle("Client", fontName="Helvetica", fontSize=10, leading=14),
-        "center": ParagraphStyle("Center", fontName="Helvetica", fontSize=10, alignment=TA_CENTER),
-        "center_bold": ParagraphStyle("CenterBold", fontName="Helvetica-Bold", fontSize=10,
-                                       alignment=TA_CENTER),
-        "note": ParagraphStyle("Note", fontName="Helvetica-Oblique", fontSize=9,
-                               textColor=colors.grey, alignment=TA_CENTER),
-        "thanks": ParagraphStyle("Thanks", fontName="Helvetica-BoldOblique", fontSize=10,
-                                  alignment=TA_CENTER),
-        "footer": ParagraphStyle("Footer", fontName="Helvetica", fontSize=8, alignment=TA_CENTER),
-    }
+
+def build_invoice_elements(date_str: str, line_items: list[dict], config: dict[str, Any]) -> list:
+    sender = config["sender"]
+    client = config["client"]
+    bank = config["bank"]
+    invoice_cfg = config["invoice"]
+    styles = _STYLES
+
+    formatted_date, invoice_number = _invoice_date_and_number(date_str, invoice_cfg["number_prefix"])
 
     elements = []
 
@@ -141,17 +248,13 @@ def create_invoice(date_str: str, line_items: list[dict], output_path: str, conf
         ],
     ]
     header_table = Table(header_data, colWidths=[3.5 * inch, 3.5 * inch])
-    header_table.setStyle(TableStyle([
-        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-        ("ALIGN", (1, 0), (1, -1), "RIGHT"),
-    ]))
+    header_table.setStyle(_HEADER_TABLE_STYLE)
     elements.append(header_table)
     elements.append(Spacer(1, 0.3 * inch))
 
     elements.append(Paragraph("Bill To:", styles["section_header"]))
     elements.append(Spacer(1, 2))
 
-    from reportlab.platypus import HRFlowable
     elements.append(HRFlowable(width="100%", thickness=1, color=colors.black))
     elements.append(Spacer(1, 6))
 
@@ -161,46 +264,17 @@ def create_invoice(date_str: str, line_items: list[dict], output_path: str, conf
     ))
     elements.append(Spacer(1, 0.25 * inch))
 
-    table_data = [["Hours", "Description", "Rate", "Amount"]]
-
-    total = Decimal("0")
-    for item in line_items:
-        hours = item["hours"]
-        desc = item["description"]
-        rate = item["rate"]
-        amount = Decimal(str(hours)) * Decimal(str(rate))
-        total += amount
-        table_data.append([
-            f"{hours:.1f}" if hours else "",
-            desc,
-            f"${rate:.2f}",
-            format_currency(float(amount)),
-        ])
+    item_rows, total_cents = _line_item_rows(line_items)
+    table_data = [["Hours", "Description", "Rate", "Amount"], *item_rows]
 
     empty_rows_needed = max(0, 8 - len(table_data))
     for _ in range(empty_rows_needed):
         table_data.append(["", "", "", ""])
 
-    table_data.append(["", "", "Total", format_currency(float(total))])
-
-    col_widths = [0.8 * inch, 4.0 * inch, 1.0 * inch, 1.2 * inch]
-    items_table = Table(table_data, colWidths=col_widths)
-
-    table_style = [
-        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-        ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-        ("FONTSIZE", (0, 0), (-1, -1), 10),
-        ("ALIGN", (0, 0), (2, -1), "LEFT"),
-        ("ALIGN", (3, 0), (3, -1), "RIGHT"),
-        ("GRID", (0, 0), (-1, -2), 0.5, colors.black),
-        ("BOX", (2, -1), (3, -1), 0.5, colors.black),
-        ("LINEABOVE", (2, -1), (3, -1), 0.5, colors.black),
-        ("FONTNAME", (2, -1), (3, -1), "Helvetica-Bold"),
-        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        ("TOPPADDING", (0, 0), (-1, -1), 4),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-    ]
-    items_table.setStyle(TableStyle(table_style))
+    table_data.append(["", "", "Total", format_currency(total_cents)])
+
+    items_table = Table(table_data, colWidths=_ITEMS_COL_WIDTHS)
+    items_table.setStyle(_ITEMS_TABLE_STYLE)
     elements.append(items_table)
     elements.append(Spacer(1, 0.3 * inch))
 
@@ -219,14 +293,316 @@ def create_invoice(date_str: str, line_items: list[dict], output_path: str, conf
     elements.append(Spacer(1, 0.3 * inch))
 
     elements.append(Paragraph(
-        f"{sender['name']} {sender['address_1']}, {sender['address_2']} Phone {sender['phone']} {sender['email']}",
+        _footer_text(sender),
         styles["footer"]
     ))
 
-    doc.build(elements)
+    return elements
+
+
+def fits_fixed_layout(date_str: str, line_items: list[dict], config: dict[str, Any]) -> bool:
+    if len(line_items) > _FIXED_ITEM_ROWS:
+        return False
+    sender = config["sender"]
+    client = config["client"]
+    bank = config["bank"]
+    # Platypus interprets markup and entities in config text; the canvas draws it
+    # literally, so only plain text can take the fixed layout
+    config_text = [config["invoice"]["number_prefix"], *sender.values(), *client.values(), *bank.values()]
+    if any("&" in f"{text}" or "<" in f"{text}" for text in config_text):
+        return False
+    # Paragraphs also collapse runs of whitespace, break lines at newlines and
+    # drop lines that end up empty, which moves everything after them
+    if any(not f"{text}" or _collapses_in_paragraph(f"{text}") for text in config_text[1:]):
+        return False
+    # The prefix is drawn between the label's trailing space and the date
+    if _collapses_in_paragraph(f"# {config_text[0]}0"):
+        return False
+    # Table cells split on newlines and grow the row to fit
+    if any("\n" in item["description"] or "\r" in item["description"] for item in line_items):
+        return False
+    formatted_date, invoice_number = _invoice_date_and_number(date_str, config["invoice"]["number_prefix"])
+
+    header_lines = [f"{sender[key]}" for key in ("name", "address_1", "address_2", "email", "phone")]
+    if any(stringWidth(line, "Helvetica", 10) > _FIXED_HEADER_TEXT_WIDTH for line in header_lines):
+        return False
+    meta_lines = [("Date:", f" {formatted_date}"), ("Invoice #:", f" {invoice_number}")]
+    if any(stringWidth(label, "Helvetica-Bold", 10) + stringWidth(value, "Helvetica", 10)
+           > _FIXED_HEADER_TEXT_WIDTH for label, value in meta_lines):
+        return False
+
+    body_lines = [
+        ("Helvetica", 10, f"{client['name']}"),
+        ("Helvetica", 10, f"{client['company']}"),
+        ("Helvetica", 10, f"{client['address_1']}"),
+        ("Helvetica", 10, f"{client['address_2']}"),
+        ("Helvetica", 10, f"Account Number: {bank['account']}"),
+        ("Helvetica", 10, f"ACH Routing Number: {bank['ach_routing']}"),
+        ("Helvetica", 10, f"Wire Routing Number: {bank['wire_routing']}"),
+        ("Helvetica-Oblique", 9, f"Make all checks payable to {sender['name']}"),
+        ("Helvetica", 8, _footer_text(sender)),
+    ]
+    return all(stringWidth(text, font, size) <= _FIXED_BODY_TEXT_WIDTH for font, size, text in body_lines)
+
+
+def _collapses_in_paragraph(text: str) -> bool:
+    return " ".join(text.split()) != text
+
+
+def _footer_text(sender: dict[str, Any]) -> str:
+    return f"{sender['name']} {sender['address_1']}, {sender['address_2']} Phone {sender['phone']} {sender['email']}"
+
+
+def _draw_invoice_layout(c: Canvas, config: dict[str, Any]):
+    # Everything on the page that doesn't vary between invoices for the same config
+    sender = config["sender"]
+    client = config["client"]
+    bank = config["bank"]
+    left, right, center = _FIXED_TEXT_LEFT, _FIXED_TEXT_RIGHT, _FIXED_PAGE_CENTER
+
+    c.setFont("Helvetica", 10)
+    for i, key in enumerate(("name", "address_1", "address_2", "email", "phone")):
+        c.drawString(left, _FIXED_SENDER_TOP - _FIXED_LINE_LEADING * i, f"{sender[key]}")
+
+    c.setFillColor(colors.grey)
+    c.setFont("Helvetica-Bold", 28)
+    c.drawRightString(right, _FIXED_TITLE_BASELINE, "INVOICE")
+    c.setFillColor(colors.black)
+
+    c.setFont("Helvetica-Bold", 10)
+    c.drawString(left, _FIXED_BILL_TO_BASELINE, "Bill To:")
+    c.setLineWidth(1)
+    c.line(left, _FIXED_BILL_TO_RULE, right, _FIXED_BILL_TO_RULE)
+
+    c.setFont("Helvetica", 10)
+    for i, key in enumerate(("name", "company", "address_1", "address_2")):
+        c.drawString(left, _FIXED_CLIENT_TOP - _FIXED_LINE_LEADING * i, f"{client[key]}")
+
+    edges = _FIXED_COL_EDGES
+    table_bottom = _FIXED_TABLE_TOP - _FIXED_ROW_HEIGHT * (_FIXED_ITEM_ROWS + 1)
+    header_baseline = _FIXED_TABLE_TOP - _FIXED_CELL_BASELINE_OFFSET
+    c.setFont("Helvetica-Bold", 10)
+    for col, heading in enumerate(("Hours", "Description", "Rate")):
+        c.drawString(edges[col] + _FIXED_CELL_PADDING, header_baseline, heading)
+    c.drawRightString(edges[4] - _FIXED_CELL_PADDING, header_baseline, "Amount")
+
+    c.setLineWidth(0.5)
+    for row_index in range(_FIXED_ITEM_ROWS + 2):
+        y = _FIXED_TABLE_TOP - _FIXED_ROW_HEIGHT * row_index
+        c.line(edges[0], y, edges[4], y)
+    for x in edges:
+        c.line(x, _FIXED_TABLE_TOP, x, table_bottom)
+    c.rect(edges[2], table_bottom - _FIXED_ROW_HEIGHT, edges[4] - edges[2], _FIXED_ROW_HEIGHT)
+    c.drawString(edges[2] + _FIXED_CELL_PADDING, table_bottom - _FIXED_CELL_BASELINE_OFFSET, "Total")
+
+    c.setFont("Helvetica", 10)
+    bank_lines = [
+        f"Account Number: {bank['account']}",
+        f"ACH Routing Number: {bank['ach_routing']}",
+        f"Wire Routing Number: {bank['wire_routing']}",
+    ]
+    for i, line in enumerate(bank_lines):
+        c.drawCentredString(center, _FIXED_BANK_TOP - _FIXED_BANK_LEADING * i, line)
+
+    c.setFillColor(colors.grey)
+    c.setFont("Helvetica-Oblique", 9)
+    c.drawCentredString(center, _FIXED_NOTE_BASELINE, f"Make all checks payable to {sender['name']}")
+    c.setFillColor(colors.black)
+
+    c.setFont("Helvetica-BoldOblique", 10)
+    c.drawCentredString(center, _FIXED_THANKS_BASELINE, "Thank you for your business!")
+
+    c.setFont("Helvetica", 8)
+    c.drawCentredString(center, _FIXED_FOOTER_BASELINE, _footer_text(sender))
+
+
+def _invoice_text_slots(date_str: str, line_items: list[dict],
+                        config: dict[str, Any]) -> list[tuple[str, float, float, str]]:
+    # Per-invoice text as (font, x, y, text) at 10pt. Right-aligned text already has
+    # its x resolved, and there is always one slot per cell of the fixed item rows.
+    formatted_date, invoice_number = _invoice_date_and_number(date_str, config["invoice"]["number_prefix"])
+    right = _FIXED_TEXT_RIGHT
+    slots = []
+
+    meta_lines = (
+        (_FIXED_DATE_BASELINE, "Date:", f" {formatted_date}"),
+        (_FIXED_NUMBER_BASELINE, "Invoice #:", f" {invoice_number}"),
+    )
+    for y, label, value in meta_lines:
+        value_x = right - stringWidth(value, "Helvetica", 10)
+        slots.append(("Helvetica", value_x, y, value))
+        slots.append(("Helvetica-Bold", value_x - stringWidth(label, "Helvetica-Bold", 10), y, label))
+
+    item_rows, total_cents = _line_item_rows(line_items)
+    item_rows += [["", "", "", ""]] * (_FIXED_ITEM_ROWS - len(item_rows))
+    edges = _FIXED_COL_EDGES
+    for row_index, row in enumerate(item_rows, start=1):
+        y = _FIXED_TABLE_TOP - _FIXED_CELL_BASELINE_OFFSET - _FIXED_ROW_HEIGHT * row_index
+        for col, text in enumerate(row[:3]):
+            slots.append(("Helvetica", edges[col] + _FIXED_CELL_PADDING, y, text))
+        slots.append(("Helvetica", edges[4] - _FIXED_CELL_PADDING - stringWidth(row[3], "Helvetica", 10), y, row[3]))
+
+    total = format_currency(total_cents)
+    table_bottom = _FIXED_TABLE_TOP - _FIXED_ROW_HEIGHT * (_FIXED_ITEM_ROWS + 1)
+    total_x = edges[4] - _FIXED_CELL_PADDING - stringWidth(total, "Helvetica-Bold", 10)
+    slots.append(("Helvetica-Bold", total_x, table_bottom - _FIXED_CELL_BASELINE_OFFSET, total))
+    return slots
+
+
+def _draw_invoice_page(c: Canvas, date_str: str, line_items: list[dict], config: dict[str, Any]):
+    _draw_invoice_layout(c, config)
+    for font, x, y, text in _invoice_text_slots(date_str, line_items, config):
+        if text:
+            c.setFont(font, 10)
+            c.drawString(x, y, text)
+    c.showPage()
+
+
+def create_invoice_fast(date_str: str, line_items: list[dict], output_path: str, config: dict[str, Any]):
+    c = Canvas(output_path, pagesize=letter)
+    _draw_invoice_page(c, date_str, line_items, config)
+    c.save()
+    print(f"Invoice created: {output_path}")
+
+
+class InvoiceTemplate:
+    """Fixed-layout invoice PDF rendered once per config, then filled in per invoice.
+
+    The template is drawn uncompressed with every per-invoice text slot holding a
+    fixed-width placeholder string, positioned at a unique sentinel x coordinate.
+    Rendering an invoice replaces each placeholder and sentinel with the real text
+    and x coordinate, padded with content-stream whitespace to the same byte
+    length, so the PDF's stream lengths and xref offsets stay valid and no
+    ReportLab drawing happens per invoice.
+    """
+
+    def __init__(self, config: dict[str, Any]):
+        self.config = config
+        placeholder_date = "2000-01-01"
+        slots = _invoice_text_slots(placeholder_date, [], config)
+
+        buffer = BytesIO()
+        c = Canvas(buffer, pagesize=letter, pageCompression=0)
+        _draw_invoice_layout(c, config)
+        self._slots = []
+        for i, (font, _, y, _) in enumerate(slots):
+            token = f"@@{i:03d}@@".ljust(_TEMPLATE_SLOT_BYTES, "#")
+            sentinel_x = 9000 + i + 0.25
+            c.setFont(font, 10)
+            c.drawString(sentinel_x, y, token)
+            self._slots.append((f"({token})".encode("ascii"), f" {sentinel_x:.2f} {fp_str(y)} Tm".encode("ascii")))
+        c.showPage()
+        c.save()
+        self._template_bytes = buffer.getvalue()
+
+        for token, sentinel in self._slots:
+            if self._template_bytes.count(token) != 1 or self._template_bytes.count(sentinel) != 1:
+                raise RuntimeError("Invoice template placeholders are not unique")
+
+        # Each output gets its own document ID and creation date rather than the template's
+        id_match = re.search(rb"/ID\s*\[<([0-9a-f]{32})><\1>\]", self._template_bytes)
+        date_match = re.search(rb"/CreationDate \((D:[^)]*)\)", self._template_bytes)
+        if id_match is None or date_match is None:
+            raise RuntimeError("Invoice template has no document ID or creation date")
+        self._document_id = id_match.group(1)
+        self._creation_date = date_match.group(1)
+
+    def render(self, date_str: str, line_items: list[dict], output_path: str) -> bool:
+        # Returns False, writing nothing, for invoices the template can't represent
+        if not fits_fixed_layout(date_str, line_items, self.config):
+            return False
+
+        data = self._template_bytes
+        for (token, sentinel), (_, x, y, text) in zip(
+            self._slots, _invoice_text_slots(date_str, line_items, self.config)
+        ):
+            try:
+                value = f"({escapePDF(text.encode('cp1252'))})".encode("latin-1")
+            except UnicodeEncodeError:
+                return False
+            position = f" {x:.2f} {fp_str(y)} Tm".encode("ascii")
+            if len(value) > len(token) or len(position) > len(sentinel):
+                return False
+            data = data.replace(token, value.ljust(len(token)))
+            data = data.replace(sentinel, position.rjust(len(sentinel)))
+
+        document_id = hashlib.md5(output_path.encode() + data, usedforsecurity=False).hexdigest()
+        data = data.replace(self._document_id, document_id.encode("ascii"))
+        creation_date = _pdf_date(datetime.now().astimezone())
+        if len(creation_date) == len(self._creation_date):
+            data = data.replace(self._creation_date, creation_date)
+
+        with open(output_path, "wb") as f:
+            f.write(data)
+        print(f"Invoice created: {output_path}")
+        return True
+
+
+def _pdf_date(moment: datetime) -> bytes:
+    # Same form ReportLab writes for /CreationDate, e.g. D:20250305120000+01'00'
+    offset_minutes = int(moment.utcoffset().total_seconds()) // 60
+    sign = "-" if offset_minutes < 0 else "+"
+    hours, minutes = divmod(abs(offset_minutes), 60)
+    return f"D:{moment:%Y%m%d%H%M%S}{sign}{hours:02d}'{minutes:02d}'".encode("ascii")
+
+
+def create_invoice(date_str: str, line_items: list[dict], output_path: str, config: dict[str, Any]):
+    if fits_fixed_layout(date_str, line_items, config):
+        create_invoice_fast(date_str, line_items, output_path, config)
+        return
+    _new_doc(output_path).build(build_invoice_elements(date_str, line_items, config))
     print(f"Invoice created: {output_path}")
 
 
+def _render_one(job: tuple[str, list[dict], str, dict[str, Any]]):
+    create_invoice(*job)
+
+
+def create_invoices_batch(jobs: list[InvoiceJob], config: dict[str, Any], combined_output: str | None = None):
+    # A combined output is written in one pass, one page per invoice
+    if combined_output is None:
+        # Fixed-layout invoices are filled in from one shared template; only the rest
+        # need a full ReportLab render
+        try:
+            template = InvoiceTemplate(config)
+        except RuntimeError:
+            # The template relies on how ReportLab serialises text; if that ever
+            # changes, render everything the normal way instead of failing the batch
+            template = None
+        if template is not None:
+            jobs = [job for job in jobs if not template.render(*job)]
+        if len(jobs) >= _PARALLEL_MIN_JOBS:
+            max_workers = min(os.cpu_count() or 1, len(jobs))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(_render_one, [(*job, config) for job in jobs]))
+        else:
+            for date_str, line_items, output_path in jobs:
+                create_invoice(date_str, line_items, output_path, config)
+        return
+
+    if all(fits_fixed_layout(date_str, line_items, config) for date_str, line_items, _ in jobs):
+        c = Canvas(combined_output, pagesize=letter)
+        for date_str, line_items, _ in jobs:
+            _draw_invoice_page(c, date_str, line_items, config)
+        c.save()
+        print(f"Invoices created: {combined_output} ({len(jobs)} invoices)")
+        return
+
+    elements = []
+    for date_str, line_items, _ in jobs:
+        if elements:
+            elements.append(PageBreak())
+        elements.extend(build_invoice_elements(date_str, line_items, config))
+    _new_doc(combined_output).build(elements)
+    print(f"Invoices created: {combined_output} ({len(jobs)} invoices)")
+
+
+def _default_output_path(invoice_cfg: dict[str, Any], date_str: str, csv_path: str | None = None) -> str:
+    date_formatted = date_str.replace("-", "")
+    suffix = f"_{Path(csv_path).stem}" if csv_path else ""
+    return f"{invoice_cfg['filename_prefix']}_{date_formatted}{suffix}.pdf"
+
+
 def main():
     args = parse_args()
 
@@ -238,7 +614,20 @@ def main():
     invoice_cfg = config["invoice"]
 
     if args.csv:
-        line_items = load_line_items_from_csv(args.csv)
+        jobs = [
+            (args.date, load_line_items_from_csv(csv_path), _default_output_path(invoice_cfg, args.date, csv_path))
+            for csv_path in args.csv
+        ]
+        if len(jobs) > 1:
+            output_paths = [output_path for _, _, output_path in jobs]
+            duplicates = sorted({path for path in output_paths if output_paths.count(path) > 1})
+            if not args.output and duplicates:
+                print(f"Error: CSV files with the same name would overwrite {', '.join(duplicates)}; "
+                      "rename them or use --output to combine them")
+                return
+            create_invoices_batch(jobs, config, combined_output=args.output)
+            return
+        line_items = jobs[0][1]
     elif args.hours:
         line_items = [{
             "hours": args.hours,
@@ -249,12 +638,7 @@ def main():
         print("Error: Must provide either --hours or --csv")
         return
 
-    if args.output:
-        output_path = args.output
-    else:
-        date_formatted = args.date.replace("-", "")
-        output_path = f"{invoice_cfg['filename_prefix']}_{date_formatted}.pdf"
-
+    output_path = args.output or _default_output_path(invoice_cfg, args.date)
     create_invoice(args.date, line_items, output_path, config)
 
 
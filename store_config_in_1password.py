@@ -8,20 +8,57 @@ Usage:
 """
 
 import argparse
+import json
+import os
+import re
 import subprocess
 import sys
 from pathlib import Path
 
 
-def item_exists(vault: str, title: str, account: str | None = None) -> bool:
-    cmd = ["op", "item", "get", title, "--vault", vault]
-    if account:
-        cmd.extend(["--account", account])
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return result.returncode == 0
+# Substring of `op item edit`'s error message when the item does not exist yet
+ITEM_NOT_FOUND_MARKER = "isn't an item"
 
+# Substrings of op's error message when a session token has expired or been revoked
+SESSION_EXPIRED_MARKERS = ("not currently signed in", "session expired")
 
-def store_config(config_path: Path, vault: str, title: str, account: str | None = None) -> str:
+# op session environment (OP_SESSION_<id>=token) by account, so a process calling
+# store_config repeatedly with reuse_session=True signs in once
+_sessions: dict[str | None, dict[str, str]] = {}
+
+
+def _get_session(account: str | None = None) -> dict[str, str]:
+    if account not in _sessions:
+        cmd = ["op", "signin"]
+        if account:
+            cmd.extend(["--account", account])
+        # stderr is left attached so op's password prompt stays visible. signin prints
+        # an `export OP_SESSION_<id>="token"` line, which names the variable op expects;
+        # with desktop app integration it prints nothing and op authenticates itself.
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, text=True, check=True)
+        match = re.search(r'(OP_SESSION_\w+)\s*=\s*"([^"]*)"', result.stdout)
+        _sessions[account] = {match.group(1): match.group(2)} if match else {}
+    return _sessions[account]
+
+
+def _run_op(cmd: list[str], account: str | None, reuse_session: bool,
+            input: str | None = None) -> subprocess.CompletedProcess:
+    if not reuse_session:
+        return subprocess.run(cmd, input=input, capture_output=True, text=True, check=True)
+    env = {**os.environ, **_get_session(account)}
+    try:
+        return subprocess.run(cmd, input=input, capture_output=True, text=True, check=True, env=env)
+    except subprocess.CalledProcessError as e:
+        if not any(marker in e.stderr for marker in SESSION_EXPIRED_MARKERS):
+            raise
+    # The cached token expired; sign in again and retry once
+    _sessions.pop(account, None)
+    env = {**os.environ, **_get_session(account)}
+    return subprocess.run(cmd, input=input, capture_output=True, text=True, check=True, env=env)
+
+
+def store_config(config_path: Path, vault: str, title: str, account: str | None = None,
+                 reuse_session: bool = False) -> str:
     if not config_path.exists():
         print(f"Error: Config file not found: {config_path}", file=sys.stderr)
         sys.exit(1)
@@ -30,29 +67,45 @@ def store_config(config_path: Path, vault: str, title: str, account: str | None
     account_args = ["--account", account] if account else []
 
     try:
-        if item_exists(vault, title, account):
+        # Updating an existing item is the common case, so try that first and only
+        # create the item when op reports it doesn't exist.
+        try:
+            # The edit still passes the whole config on argv, so it stays bound by
+            # ARG_MAX: op has no documented stdin or file form for a field
+            # assignment, and a template edit would replace the whole item,
+            # dropping any notes, tags or fields added to it.
             cmd = [
                 "op", "item", "edit", title,
                 "--vault", vault,
                 f"config[text]={config_content}",
                 *account_args,
             ]
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
+            _run_op(cmd, account, reuse_session)
             print(f"Config updated in 1Password: op://{vault}/{title}/config")
-        else:
+        except subprocess.CalledProcessError as e:
+            # A failed signin has no captured stderr and isn't a missing item
+            if not e.stderr or ITEM_NOT_FOUND_MARKER not in e.stderr:
+                raise
+            # A new item is created from a JSON template on stdin ("-"), so on
+            # this path the config doesn't go through argv
+            template = json.dumps({
+                "title": title,
+                "category": "SECURE_NOTE",
+                "fields": [{"id": "config", "label": "config", "type": "STRING", "value": config_content}],
+            })
             cmd = [
                 "op", "item", "create",
-                "--category", "Secure Note",
                 "--vault", vault,
-                "--title", title,
-                f"config[text]={config_content}",
                 *account_args,
+                "-",
             ]
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
+            _run_op(cmd, account, reuse_session, input=template)
             print(f"Config stored in 1Password: op://{vault}/{title}/config")
         return f"op://{vault}/{title}/config"
     except subprocess.CalledProcessError as e:
-        print(f"Failed to store in 1Password: {e.stderr.strip()}", file=sys.stderr)
+        # op signin's stderr isn't captured, so it has already been shown
+        detail = e.stderr.strip() if e.stderr else f"op {e.cmd[1]} exited with status {e.returncode}"
+        print(f"Failed to store in 1Password: {detail}", file=sys.stderr)
         sys.exit(1)
     except FileNotFoundError:
         print("1Password CLI (op) not found. Install it from https://1password.com/downloads/command-line/", file=sys.stderr)
@@ -0,0 +1,55 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pypdf import PdfReader
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+import create_invoice
+from create_invoice import build_invoice_elements, load_config
+
+CONFIG = load_config(Path(__file__).parent.parent / "config.example.toml")
+
+DATE = "2025-03-05"
+
+
+def words(pdf_path: Path) -> list[tuple[str, float, float]]:
+    # (text, x, y) of every drawn string on the first page. Only text is
+    # compared: table rules and the grid are fixed geometry and not checked.
+    # Platypus draws mixed-font paragraph runs from one text position, so runs
+    # sharing a position are advanced by the width of the text before them.
+    found = []
+    last_origin = None
+    advance = 0.0
+
+    def visit(text, cm, tm, font_dict, font_size):
+        nonlocal last_origin, advance
+        if not text or font_dict is None:
+            return
+        x = tm[4] * cm[0] + tm[5] * cm[2] + cm[4]
+        y = tm[4] * cm[1] + tm[5] * cm[3] + cm[5]
+        if (x, y) != last_origin:
+            last_origin, advance = (x, y), 0.0
+        # pypdf also reports bare spaces it infers from text positioning; skip those
+        if text.strip():
+            found.append((text.strip(), x + advance, y))
+            advance += stringWidth(text, font_dict["/BaseFont"][1:], font_size)
+
+    PdfReader(pdf_path).pages[0].extract_text(visitor_text=visit)
+    return sorted(found)
+
+
+def assert_same_text(pdf_path: Path, expected_path: Path):
+    drawn, expected = words(pdf_path), words(expected_path)
+    assert [text for text, _, _ in drawn] == [text for text, _, _ in expected]
+    for (text, x, y), (_, expected_x, expected_y) in zip(drawn, expected):
+        assert (x, y) == pytest.approx((expected_x, expected_y), abs=0.01), text
+
+
+def platypus_pdf(path: Path, line_items: list[dict], config: dict[str, Any] = CONFIG) -> Path:
+    create_invoice._new_doc(str(path)).build(build_invoice_elements(DATE, line_items, config))
+    return path
+
+
+def with_config(section: str, key: str, value: Any) -> dict[str, Any]:
+    return {**CONFIG, section: {**CONFIG[section], key: value}}
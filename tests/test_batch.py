@@ -0,0 +1,70 @@
+import sys
+from pathlib import Path
+
+import pytest
+from pypdf import PdfReader
+
+import create_invoice
+from create_invoice import create_invoices_batch, fits_fixed_layout
+from pdf_text import CONFIG, DATE
+
+CONFIG_PATH = Path(__file__).parent.parent / "config.example.toml"
+
+
+def _jobs(tmp_path: Path, count: int, items_per_job: int) -> list:
+    # Each invoice's first line item names it, so pages can be told apart
+    return [
+        (DATE,
+         [{"hours": 1.0, "description": f"Invoice {i} item {n}", "rate": 10.0} for n in range(items_per_job)],
+         str(tmp_path / f"invoice_{i}.pdf"))
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("items_per_job, fits", [(2, True), (8, False)], ids=["canvas", "platypus"])
+def test_combined_output_has_one_page_per_job(tmp_path, items_per_job, fits):
+    jobs = _jobs(tmp_path, 3, items_per_job)
+    combined = tmp_path / "combined.pdf"
+    assert all(fits_fixed_layout(date_str, line_items, CONFIG) is fits for date_str, line_items, _ in jobs)
+
+    create_invoices_batch(jobs, CONFIG, combined_output=str(combined))
+
+    pages = PdfReader(combined).pages
+    assert len(pages) == len(jobs)
+    for i, page in enumerate(pages):
+        assert f"Invoice {i} item 0" in page.extract_text()
+    assert not any(Path(output_path).exists() for _, _, output_path in jobs)
+
+
+def test_main_refuses_colliding_csv_stems(tmp_path, monkeypatch, capsys):
+    for folder in ("a", "b"):
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "jan.csv").write_text("hours,description,rate\n1,Work,10\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", [
+        "create_invoice.py", "--config", str(CONFIG_PATH), "--date", DATE, "--csv", "a/jan.csv", "b/jan.csv",
+    ])
+
+    create_invoice.main()
+
+    assert "Error: CSV files with the same name would overwrite Invoice_20250305_jan.pdf" in capsys.readouterr().out
+    assert not list(tmp_path.glob("*.pdf"))
+
+
+def test_large_batch_renders_in_process_pool(tmp_path, monkeypatch):
+    pools = []
+
+    class RecordingPool(create_invoice.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            pools.append(self)
+
+    monkeypatch.setattr(create_invoice, "ProcessPoolExecutor", RecordingPool)
+    # Too many line items for the fixed layout, so none go through the template
+    jobs = _jobs(tmp_path, 4, 8)
+
+    create_invoices_batch(jobs, CONFIG)
+
+    assert len(pools) == 1
+    for i, (_, _, output_path) in enumerate(jobs):
+        assert f"Invoice {i} item 7" in PdfReader(output_path).pages[0].extract_text()
@@ -0,0 +1,35 @@
+import pytest
+
+from create_invoice import create_invoice, fits_fixed_layout
+from pdf_text import CONFIG, DATE, assert_same_text, platypus_pdf, with_config
+
+LINE_ITEMS = [
+    {"hours": 100.0, "description": "Software Development", "rate": 150.0},
+    {"hours": 2.5, "description": "Code Review", "rate": 99.99},
+]
+
+
+@pytest.mark.parametrize("config, line_items, fits", [
+    (CONFIG, LINE_ITEMS, True),
+    (with_config("sender", "phone", ""), LINE_ITEMS, False),
+    (with_config("client", "address_2", ""), LINE_ITEMS, False),
+    (with_config("bank", "account", "   "), LINE_ITEMS, False),
+    (with_config("client", "company", "Client\nCompany"), LINE_ITEMS, False),
+    (with_config("sender", "name", "Your  Name"), LINE_ITEMS, False),
+    (with_config("client", "name", " Client Name"), LINE_ITEMS, False),
+    (with_config("sender", "email", "you@example.com "), LINE_ITEMS, False),
+    (with_config("invoice", "number_prefix", "INV\t"), LINE_ITEMS, False),
+    (with_config("invoice", "number_prefix", "INV-"), LINE_ITEMS, True),
+    (CONFIG, [{"hours": 1.0, "description": "Line one\nLine two", "rate": 10.0}], False),
+    (CONFIG, [{"hours": 1.0, "description": "Line one\r\nLine two", "rate": 10.0}], False),
+], ids=[
+    "plain", "empty-phone", "empty-address", "blank-account", "newline-config", "double-space",
+    "leading-space", "trailing-space", "tab-prefix", "plain-prefix", "newline-description",
+    "crlf-description",
+])
+def test_create_invoice_matches_platypus(tmp_path, config, line_items, fits):
+    output = tmp_path / "invoice.pdf"
+
+    assert fits_fixed_layout(DATE, line_items, config) is fits
+    create_invoice(DATE, line_items, str(output), config)
+    assert_same_text(output, platypus_pdf(tmp_path / "platypus.pdf", line_items, config))
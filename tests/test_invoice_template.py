@@ -0,0 +1,64 @@
+import pytest
+from pypdf import PdfReader
+
+import create_invoice
+from create_invoice import InvoiceTemplate, create_invoices_batch
+from pdf_text import CONFIG, DATE, assert_same_text, platypus_pdf, with_config
+
+
+@pytest.mark.parametrize("config, description, renders", [
+    (CONFIG, "Software Development", True),
+    (CONFIG, "Parens (and) unbalanced :) back\\slash", True),
+    (CONFIG, "Café naïve – résumé", True),
+    (with_config("sender", "phone", ""), "Software Development", False),
+    (with_config("client", "address_2", ""), "Software Development", False),
+    (CONFIG, "Line one\nLine two", False),
+], ids=["plain", "escapes", "cp1252", "empty-sender-field", "empty-client-field", "newline-description"])
+def test_template_matches_platypus(tmp_path, config, description, renders):
+    """Only drawn text is compared; table rules and the grid are not checked.
+
+    Invoices the template can't render exactly are left to the batch's
+    normal render, so those are compared after that fallback.
+    """
+    line_items = [
+        {"hours": 100.0, "description": description, "rate": 150.0},
+        {"hours": 2.5, "description": "Code Review", "rate": 99.99},
+    ]
+    output = tmp_path / "template.pdf"
+
+    assert InvoiceTemplate(config).render(DATE, line_items, str(output)) is renders
+    if not renders:
+        assert not output.exists()
+        create_invoices_batch([(DATE, line_items, str(output))], config)
+    assert_same_text(output, platypus_pdf(tmp_path / "platypus.pdf", line_items, config))
+
+
+def test_template_rejects_unencodable_text(tmp_path):
+    line_items = [{"hours": 1.0, "description": "Check ✓", "rate": 10.0}]
+    output = tmp_path / "template.pdf"
+
+    assert not InvoiceTemplate(CONFIG).render(DATE, line_items, str(output))
+    assert not output.exists()
+
+
+def test_outputs_get_distinct_document_ids(tmp_path):
+    template = InvoiceTemplate(CONFIG)
+    line_items = [{"hours": 1.0, "description": "Work", "rate": 10.0}]
+    template.render(DATE, line_items, str(tmp_path / "a.pdf"))
+    template.render(DATE, line_items, str(tmp_path / "b.pdf"))
+
+    ids = [PdfReader(tmp_path / name).trailer["/ID"][0] for name in ("a.pdf", "b.pdf")]
+    assert ids[0] != ids[1]
+
+
+def test_batch_falls_back_when_template_fails(tmp_path, monkeypatch):
+    def broken_template(config):
+        raise RuntimeError("Invoice template placeholders are not unique")
+
+    monkeypatch.setattr(create_invoice, "InvoiceTemplate", broken_template)
+    line_items = [{"hours": 1.0, "description": "Work", "rate": 10.0}]
+    jobs = [(DATE, line_items, str(tmp_path / f"{name}.pdf")) for name in ("a", "b")]
+
+    create_invoices_batch(jobs, CONFIG)
+
+    assert (tmp_path / "a.pdf").exists() and (tmp_path / "b.pdf").exists()
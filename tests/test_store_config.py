@@ -0,0 +1,121 @@
+import json
+import subprocess
+
+import pytest
+
+import store_config_in_1password
+from store_config_in_1password import store_config
+
+CONFIG_TEXT = 'name = "Your Name"\n'
+
+
+class FakeOp:
+    """Stands in for subprocess.run, replying to each op call in turn."""
+
+    def __init__(self, *replies):
+        # Each reply is stdout text, or (returncode, stderr) for a failure
+        self.replies = list(replies)
+        self.calls = []
+
+    def __call__(self, cmd, input=None, env=None, **kwargs):
+        self.calls.append({"cmd": cmd, "input": input, "env": env})
+        reply = self.replies.pop(0)
+        if isinstance(reply, tuple):
+            returncode, stderr = reply
+            raise subprocess.CalledProcessError(returncode, cmd, output="", stderr=stderr)
+        return subprocess.CompletedProcess(cmd, 0, stdout=reply, stderr="")
+
+    def commands(self):
+        return [call["cmd"][1:3] for call in self.calls]
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config.toml"
+    path.write_text(CONFIG_TEXT)
+    return path
+
+
+@pytest.fixture
+def fake_op(monkeypatch):
+    monkeypatch.setattr(store_config_in_1password, "_sessions", {})
+
+    def install(*replies):
+        op = FakeOp(*replies)
+        monkeypatch.setattr(subprocess, "run", op)
+        return op
+
+    return install
+
+
+def test_edit_of_existing_item_is_one_call(config_path, fake_op):
+    op = fake_op("")
+
+    assert store_config(config_path, "Private", "invoice-config") == "op://Private/invoice-config/config"
+    assert op.commands() == [["item", "edit"]]
+
+
+def test_missing_item_is_created_from_stdin(config_path, fake_op):
+    op = fake_op((1, '[ERROR] "invoice-config" isn\'t an item in the "Private" vault'), "")
+
+    store_config(config_path, "Private", "invoice-config", account="my.1password.com")
+
+    assert op.commands() == [["item", "edit"], ["item", "create"]]
+    create = op.calls[1]
+    assert not any(CONFIG_TEXT in arg for arg in create["cmd"])
+    assert create["cmd"][-1] == "-" and "--account" in create["cmd"]
+    template = json.loads(create["input"])
+    assert template["title"] == "invoice-config"
+    assert template["fields"][0]["value"] == CONFIG_TEXT
+
+
+def test_other_edit_errors_exit(config_path, fake_op, capsys):
+    op = fake_op((1, "[ERROR] vault \"Private\" not found"))
+
+    with pytest.raises(SystemExit) as exit_info:
+        store_config(config_path, "Private", "invoice-config")
+
+    assert exit_info.value.code == 1
+    assert op.commands() == [["item", "edit"]]
+    assert 'vault "Private" not found' in capsys.readouterr().err
+
+
+SIGNIN_OUTPUT = 'export OP_SESSION_abc123="token-1"\n'
+
+
+def test_reused_session_signs_in_once(config_path, fake_op):
+    op = fake_op(SIGNIN_OUTPUT, "", "")
+
+    store_config(config_path, "Private", "invoice-config", reuse_session=True)
+    store_config(config_path, "Private", "invoice-config", reuse_session=True)
+
+    assert op.commands() == [["signin"], ["item", "edit"], ["item", "edit"]]
+    assert all(call["env"]["OP_SESSION_abc123"] == "token-1" for call in op.calls[1:])
+    assert not any("token-1" in arg for call in op.calls for arg in call["cmd"])
+
+
+def test_expired_session_signs_in_again_and_retries_once(config_path, fake_op):
+    op = fake_op(
+        SIGNIN_OUTPUT,
+        (1, "[ERROR] session expired, sign in to create a new session"),
+        'export OP_SESSION_abc123="token-2"\n',
+        "",
+    )
+
+    store_config(config_path, "Private", "invoice-config", reuse_session=True)
+
+    assert op.commands() == [["signin"], ["item", "edit"], ["signin"], ["item", "edit"]]
+    assert op.calls[3]["env"]["OP_SESSION_abc123"] == "token-2"
+    assert store_config_in_1password._sessions == {None: {"OP_SESSION_abc123": "token-2"}}
+
+
+def test_failed_signin_reports_exit_status(config_path, fake_op, capsys):
+    # signin's stderr goes straight to the terminal, so the error carries none
+    op = fake_op((1, None))
+
+    with pytest.raises(SystemExit) as exit_info:
+        store_config(config_path, "Private", "invoice-config", reuse_session=True)
+
+    assert exit_info.value.code == 1
+    assert op.commands() == [["signin"]]
+    assert "op signin exited with status 1" in capsys.readouterr().err